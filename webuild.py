@@ -8,6 +8,9 @@
 ####                                                                       ####
 ####    Summary: Command line tool for the `web-build` package.            ####
 ####                                                                       ####
+####    Constants:                                                         ####
+####        PARSERS         -   dict:   File type to parser dispatch.      ####
+####                                                                       ####
 ####    Methods:                                                           ####
 ####        main(args)                                                     ####
 ####                -   Main execution method, not called on import.       ####
@@ -17,11 +20,43 @@
 ####                                                                       ####
 ###############################################################################
 ###############################################################################
-import traceback
 import sys
 
 import webuildpkg
 
+from webuildpkg import (BLUEPRINT_ID, TEMPLATE_ID, FRAGMENT_ID,
+                        PARAMETRIC_ID, get_file_type, open_input, open_output)
+
+
+###############################################################################
+#                                                                             #
+#   Command Line Tool Constants:                                              #
+#           PARSERS     -   A dict mapping each file type identifier to a     #
+#                           callable which invokes the matching parser.       #
+#                           Each callable takes the open input and output     #
+#                           files, the remaining (parameter binding)          #
+#                           command line arguments and the current line       #
+#                           number. Built once at import so that `main()`     #
+#                           dispatches with a single dict lookup; unknown     #
+#                           file types fall back to the fragment parser.      #
+#                                                                             #
+###############################################################################
+PARSERS = {
+    BLUEPRINT_ID:
+        lambda infile, outfile, args, line_no:
+            webuildpkg.blueprint.parse_blueprint(infile, line_no),
+    TEMPLATE_ID:
+        lambda infile, outfile, args, line_no:
+            webuildpkg.template.parse_template(infile, outfile, line_no),
+    FRAGMENT_ID:
+        lambda infile, outfile, args, line_no:
+            webuildpkg.fragment.parse_fragment(infile, outfile, line_no),
+    PARAMETRIC_ID:
+        lambda infile, outfile, args, line_no:
+            webuildpkg.parametric.parse_parametric(
+                    infile, outfile,
+                    webuildpkg.parametric.parse_parameters(args), line_no) }
+
 
 ###############################################################################
 #                                                                             #
@@ -49,21 +84,11 @@ import webuildpkg
 def main(args):
     infile, outfile = open_files(args[1:])
     
-    file_type, line_no = webuildpkg.get_file_type(infile, outfile)
+    file_type, line_no = get_file_type(infile, outfile)
     
-    if file_type == webuildpkg.BLUEPRINT_ID:
-        webuildpkg.blueprint.parse_blueprint(infile, line_no)
-    elif file_type == webuildpkg.TEMPLATE_ID:
-        webuildpkg.template.parse_template(infile, outfile, line_no)
-    elif file_type == webuildpkg.FRAGMENT_ID:
-        webuildpkg.fragment.parse_fragment(infile, outfile, line_no)
-    elif file_type == webuildpkg.PARAMETRIC_ID:
-        params = webuildpkg.parametric.parse_parameters(args[3:])
-        
-        webuildpkg.parametric.parse_parametric(
-                                            infile, outfile, params, line_no)
-    else:
-        webuildpkg.fragment.parse_fragment(infile, outfile, line_no)
+    parser = PARSERS.get(file_type, PARSERS[FRAGMENT_ID])
+    
+    parser(infile, outfile, args[3:], line_no)
     
     return 0
 
@@ -86,18 +111,26 @@ def main(args):
 #                                                                             #
 #   Description:                                                              #
 #       Open and return the input and output files (or return stdio           #
-#       streams) based on command line arguments.                             #
+#       streams) based on command line arguments. Absent arguments are        #
+#       detected with explicit length checks rather than by catching          #
+#       IndexError, so the common fully specified call raises nothing.        #
 #                                                                             #
 ###############################################################################
 def open_files(args):
     infile  = sys.stdin
     outfile = sys.stdout
     
-    try:
-        infile  = webuildpkg.open_input( args[0])
-        outfile = webuildpkg.open_output(args[1])
-    except (IndexError, FileNotFoundError):
-        pass
+    if args:
+        try:
+            infile = open_input(args[0])
+        except FileNotFoundError:
+            pass
+        else:
+            if len(args) > 1:
+                outfile = open_output(args[1])
+    
+    if outfile is sys.stdout and hasattr(outfile, "reconfigure"):
+        outfile.reconfigure(line_buffering=False, write_through=False)
     
     return infile, outfile
 
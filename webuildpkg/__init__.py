@@ -11,25 +11,70 @@
 ####        shared (as .)                                                  ####
 ####                -   Package Constants, Exceptions and Methods.         ####
 ####                                                                       ####
-####        blueprint                                                      ####
+####        blueprint (lazy)                                               ####
 ####                -   Methods et. al. for blueprint file handling.       ####
 ####                                                                       ####
-####        template                                                       ####
+####        template (lazy)                                                ####
 ####                -   Methods et. al. for template file handling.        ####
 ####                                                                       ####
-####        fragment                                                       ####
+####        fragment (lazy)                                                ####
 ####                -   Methods et. al. for fragment file handling.        ####
 ####                                                                       ####
-####        parametric                                                     ####
+####        parametric (lazy)                                              ####
 ####                -   Methods et. al. for parametric file handling.      ####
 ####                                                                       ####
 ###############################################################################
 ###############################################################################
+import importlib
+
 from .shared import *
-from . import blueprint
-from . import template
-from . import fragment
-from . import parametric
+
+
+###############################################################################
+#                                                                             #
+#   Package Constants:                                                        #
+#           _SUBMODULES     -   The names of the file type submodules which   #
+#                               are loaded lazily (PEP 562). A build only     #
+#                               touches the parsers it dispatches to, so      #
+#                               deferring these imports keeps cold-start      #
+#                               cost proportional to the file types           #
+#                               actually used.                                #
+#                                                                             #
+###############################################################################
+_SUBMODULES = { "blueprint",
+                "template",
+                "fragment",
+                "parametric" }
+
+
+###############################################################################
+#                                                                             #
+#   Method:                                                                   #
+#       __getattr__(name)                                                     #
+#                                                                             #
+#   Parameters:                                                               #
+#       name        -   string: the requested package attribute, required.    #
+#                                                                             #
+#   Returns:    module: the named submodule, imported on first access.        #
+#                                                                             #
+#   Raises:                                                                   #
+#       AttributeError  -   when `name` is not a lazily loaded submodule.     #
+#                                                                             #
+#   Description:                                                              #
+#       Module level attribute hook (PEP 562) which imports the file type     #
+#       submodules on first access and caches them in the package             #
+#       namespace so subsequent accesses are plain attribute lookups.         #
+#                                                                             #
+###############################################################################
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        
+        globals()[name] = module
+        
+        return module
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 ###############################################################################
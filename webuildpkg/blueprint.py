@@ -9,7 +9,7 @@
 ####             `web-build` utility file standard.                        ####
 ####                                                                       ####
 ####    Constants:                                                         ####
-####        BLUEPRINT_EXTS  -   list:   Blueprint file extension strs.     ####
+####        BLUEPRINT_EXTS  -   tuple:  Blueprint file extension strs.     ####
 ####                                                                       ####
 ####    Methods:                                                           ####
 ####        main(args)                                                     ####
@@ -21,19 +21,31 @@
 ####        parse_blueprint(infile, line_no, file_count)                   ####
 ####                -   Parse an open blueprint file.                      ####
 ####                                                                       ####
-####        _path(f)       ######################################          ####
-####                -   Get a file object's path.                          ####
-####                                                                       ####
 ####        _parse_blueprint_command(command, path, file_count,            ####
 ####                                          file_name, line_no, line)    ####
 ####                -   Parse a command from a blueprint file.             ####
 ####                                                                       ####
+####        _handle_blueprint(cmd, path, file_count,                       ####
+####                                          file_name, line_no, line)    ####
+####                -   Execute a :BLUEPRINT command.                      ####
+####                                                                       ####
+####        _handle_template(cmd, path, file_count,                        ####
+####                                          file_name, line_no, line)    ####
+####                -   Execute a :TEMPLATE command.                       ####
+####                                                                       ####
+####        _handle_fragment(cmd, path, file_count,                        ####
+####                                          file_name, line_no, line)    ####
+####                -   Execute a :FRAGMENT command.                       ####
+####                                                                       ####
+####        _handle_parametric(cmd, path, file_count,                      ####
+####                                          file_name, line_no, line)    ####
+####                -   Execute a :PARAMETRIC command.                     ####
+####                                                                       ####
 ####        _assert_blueprint(command, file_name, line_no, line)           ####
 ####                -   Check command is a blueprint file declaration.     ####
 ####                                                                       ####
 ###############################################################################
 ###############################################################################
-import traceback
 import sys
 
 try:
@@ -51,13 +63,15 @@ except ImportError:
 ###############################################################################
 #                                                                             #
 #   Blueprint Constants:                                                      #
-#           BLUEPRINT_EXTS  -   A priority ordered list of default file       #
+#           BLUEPRINT_EXTS  -   A priority ordered tuple of default file      #
 #                               extension to append to blueprint file         #
 #                               identifiers. `open_blueprint()` will try      #
-#                               each in turn until one succeeds.              #
+#                               each in turn until one succeeds. A tuple      #
+#                               so it can key the resolution cache without    #
+#                               conversion at each call.                      #
 #                                                                             #
 ###############################################################################
-BLUEPRINT_EXTS = ["", ".blueprint", ".blue"]
+BLUEPRINT_EXTS = ("", ".blueprint", ".blue")
 
 
 ###############################################################################
@@ -125,23 +139,7 @@ def main(args):
 #                                                                             #
 ###############################################################################
 def open_blueprint(name, path=None):
-    if name in shared.STDINS:
-        return sys.stdin
-    
-    if path and name[0] != '/':
-        name = f"{path}/{name}"
-    
-    for ext in BLUEPRINT_EXTS:
-        try:
-            f = open(name + ext, 'r')
-        except (FileNotFoundError, IsADirectoryError):
-            pass
-        else:
-            return f
-    
-    raise FileNotFoundError(
-        f"Not any such file, tried: "
-        f"'{'\', \''.join([name + ext for ext in BLUEPRINT_EXTS])}'.")
+    return shared.open_input(name, path, BLUEPRINT_EXTS)
 
 
 ###############################################################################
@@ -195,54 +193,29 @@ def parse_blueprint(infile, line_no=0, file_count=0):
     
     command = None
     
-    while (line := infile.readline()):
+    parse_command, file_name = shared.parse_command, infile.name
+    
+    for line in infile:
         line_no += 1
         
+        if command is None and line.lstrip()[:1] != ':':
+            continue
+        
         try:
-            command, done = shared.parse_command(
-                                        line, infile.name, line_no, command)
+            command, done = parse_command(line, file_name, line_no, command)
         except shared.ParseError:
             command = None
         else:
             if done:
                 file_count = _parse_blueprint_command(
                                     command, shared.get_file_path(infile),
-                                    file_count, infile.name, line_no, line)
+                                    file_count, file_name, line_no, line)
                 
                 command = None
     
     return file_count
 
 
-###############################################################################
-#                                                                             #
-#   Method:                                                                   #
-#       _path(f)                                                              #
-#                                                                             #
-#   Parameters:                                                               #
-#       f       -   file:   a file from which to extract the path,            #
-#                           Required.                                         #
-#                                                                             #
-#   Returns:    string: the absolute or relative path to the file.            #
-#                                                                             #
-#   Raises:                                                                   #
-#       TypeError   -   when `f` is not a file, obviously.                    #
-#                                                                             #
-#   Description:                                                              #
-#       Extracts and returns the path component from the `name` property of   #
-#       a given file, this may be a relative or absolute path depending on    #
-#       how the file was opened. Will always be "" if the file was opened     #
-#       directly from the local directory or is a numbered or named file      #
-#       stream not opened from the file system tree.                          #
-#                                                                             #
-###############################################################################
-def _path(f):
-    try:
-        return '/'.join(f.name.split('/')[:-1])
-    except AttributeError:  # f.name is not a string
-        return ""
-
-
 ###############################################################################
 #                                                                             #
 #   Method:                                                                   #
@@ -290,61 +263,28 @@ def _path(f):
 #   Description:                                                              #
 #       Take a command from a blueprint file, check its validity in the       #
 #       blueprint file context and delegate to the appropriate function.      #
+#       Branches are tested in frequency order: in real blueprint files       #
+#       valid sourced commands vastly outnumber comments, which in turn       #
+#       outnumber the error cases.                                            #
 #                                                                             #
 ###############################################################################
 def _parse_blueprint_command(
         command, path=None, file_count=0, file_name="", line_no=0, line=""):
     cmd = command[1:-1]
     
-    if cmd and cmd[0] == "" and not cmd[1:]:                    # Comment
+    if cmd and cmd[1:] \
+            and (handler := _HANDLERS.get(cmd[0])):         # Valid command
+        file_count = handler(cmd, path, file_count, file_name, line_no, line)
+    elif cmd and cmd[0] == "" and not cmd[1:]:                  # Comment
         pass
     elif cmd and cmd[0] == "":                                  # Declaration
         raise shared.ParseError(
                 f"Blueprint files may not contain declarations.",
                 (file_name, line_no, 1, line.strip()))
-    elif cmd and cmd[0] in shared.FILE_IDS and not cmd[1:]:     # No Source
+    elif cmd and cmd[0] in shared.FILE_IDS:                     # No Source
         raise shared.ParseError(
                 f"Bad :{cmd[0]} command, must specify source.",
                 (file_name, line_no, 1, line.strip()))
-    elif cmd and cmd[0] == shared.BLUEPRINT_ID:         # Valid :BLUEPRINT
-        blufile = open_blueprint(cmd[1], path)
-        
-        file_count = parse_blueprint(blufile, file_count=file_count)
-    elif cmd and cmd[0] == shared.TEMPLATE_ID:          # Valid :TEMPLATE
-        temfile = template.open_template(cmd[1], path)
-        
-        if cmd[2:] and cmd[2] != "":
-            outfile = shared.open_output(cmd[2])
-        else:
-            outfile = shared.open_output(f"{file_count}.out")
-            
-            file_count += 1
-        
-        template.parse_template(temfile, outfile)
-    elif cmd and cmd[0] == shared.FRAGMENT_ID:          # Valid :FRAGMENT
-        fragfile = fragment.open_fragment(cmd[1], path)
-        
-        if cmd[2:] and cmd[2] != "":
-            outfile = shared.open_output(cmd[2])
-        else:
-            outfile = shared.open_output(f"{file_count}.out")
-            
-            file_count += 1
-        
-        fragment.parse_fragment(fragfile, outfile)
-    elif cmd and cmd[0] == shared.PARAMETRIC_ID:        # Valid :PARAMETRIC
-        parafile = parametric.open_parametric(cmd[1], path)
-        
-        if cmd[2:] and cmd[2] != "":
-            outfile = shared.open_output(cmd[2])
-        else:
-            outfile = shared.open_output(f"{file_count}.out")
-            
-            file_count += 1
-        
-        params = parametric.parse_parameters(cmd[3:], file_name, line_no, line)
-        
-        parametric.parse_parametric(parafile, outfile, params)
     elif cmd:                                               # Other command
         raise shared.ParseError(f"Unrecognized command :{cmd[0]}.",
                                 (file_name, line_no, 1, line.strip()))
@@ -356,6 +296,236 @@ def _parse_blueprint_command(
     return file_count
 
 
+###############################################################################
+#                                                                             #
+#   Method:                                                                   #
+#       _handle_blueprint(cmd, path, file_count, file_name, line_no, line)    #
+#                                                                             #
+#   Parameters:                                                               #
+#       cmd         -   list:   the normal fields of a valid parsed command,  #
+#                               i.e. `command[1:-1]` as sliced by             #
+#                               `_parse_blueprint_command()`, required.       #
+#                                                                             #
+#       path        -   string: the path to the file being parsed, used to    #
+#                               resolve the name of the sourced file,         #
+#                               default=None.                                 #
+#                                                                             #
+#       file_count  -   int:    the number of default files already           #
+#                               written, default=0.                           #
+#                                                                             #
+#       file_name   -   string: the name of the file, only used for error     #
+#                               messages so may safely be omitted if this     #
+#                               is not required, default="".                  #
+#                                                                             #
+#       line_no     -   int:    the line number from the file, only used      #
+#                               error messages so may safely be omitted if    #
+#                               this is not required, default=0.              #
+#                                                                             #
+#       line        -   string: the line from the file, only used for error   #
+#                               messages so may safely be omitted if this     #
+#                               is not required, default="".                  #
+#                                                                             #
+#   Returns:    int:    the updated file_count.                               #
+#                                                                             #
+#   Raises:                                                                   #
+#       FileNotFoundError   -   when the sourced file can't be resolved.      #
+#                                                                             #
+#   Description:                                                              #
+#       Execute a :BLUEPRINT command: open the sourced blueprint file and     #
+#       recursively parse it, accumulating its default file count.            #
+#                                                                             #
+###############################################################################
+def _handle_blueprint(cmd, path, file_count, file_name, line_no, line):
+    blufile = open_blueprint(cmd[1], path)
+    
+    return parse_blueprint(blufile, file_count=file_count)
+
+
+###############################################################################
+#                                                                             #
+#   Method:                                                                   #
+#       _handle_template(cmd, path, file_count, file_name, line_no, line)     #
+#                                                                             #
+#   Parameters:                                                               #
+#       cmd         -   list:   the normal fields of a valid parsed command,  #
+#                               i.e. `command[1:-1]` as sliced by             #
+#                               `_parse_blueprint_command()`, required.       #
+#                                                                             #
+#       path        -   string: the path to the file being parsed, used to    #
+#                               resolve the name of the sourced file,         #
+#                               default=None.                                 #
+#                                                                             #
+#       file_count  -   int:    the number of default files already           #
+#                               written, default=0.                           #
+#                                                                             #
+#       file_name   -   string: the name of the file, only used for error     #
+#                               messages so may safely be omitted if this     #
+#                               is not required, default="".                  #
+#                                                                             #
+#       line_no     -   int:    the line number from the file, only used      #
+#                               error messages so may safely be omitted if    #
+#                               this is not required, default=0.              #
+#                                                                             #
+#       line        -   string: the line from the file, only used for error   #
+#                               messages so may safely be omitted if this     #
+#                               is not required, default="".                  #
+#                                                                             #
+#   Returns:    int:    the updated file_count.                               #
+#                                                                             #
+#   Raises:                                                                   #
+#       FileNotFoundError   -   when the sourced file can't be resolved.      #
+#                                                                             #
+#   Description:                                                              #
+#       Execute a :TEMPLATE command: open the sourced template file and       #
+#       parse it to the specified output file, or to the next default         #
+#       output file when no output is specified.                              #
+#                                                                             #
+###############################################################################
+def _handle_template(cmd, path, file_count, file_name, line_no, line):
+    temfile = template.open_template(cmd[1], path)
+    
+    if cmd[2:] and cmd[2] != "":
+        outfile = shared.open_output(cmd[2])
+    else:
+        outfile = shared.open_output(f"{file_count}.out")
+        
+        file_count += 1
+    
+    template.parse_template(temfile, outfile)
+    
+    return file_count
+
+
+###############################################################################
+#                                                                             #
+#   Method:                                                                   #
+#       _handle_fragment(cmd, path, file_count, file_name, line_no, line)     #
+#                                                                             #
+#   Parameters:                                                               #
+#       cmd         -   list:   the normal fields of a valid parsed command,  #
+#                               i.e. `command[1:-1]` as sliced by             #
+#                               `_parse_blueprint_command()`, required.       #
+#                                                                             #
+#       path        -   string: the path to the file being parsed, used to    #
+#                               resolve the name of the sourced file,         #
+#                               default=None.                                 #
+#                                                                             #
+#       file_count  -   int:    the number of default files already           #
+#                               written, default=0.                           #
+#                                                                             #
+#       file_name   -   string: the name of the file, only used for error     #
+#                               messages so may safely be omitted if this     #
+#                               is not required, default="".                  #
+#                                                                             #
+#       line_no     -   int:    the line number from the file, only used      #
+#                               error messages so may safely be omitted if    #
+#                               this is not required, default=0.              #
+#                                                                             #
+#       line        -   string: the line from the file, only used for error   #
+#                               messages so may safely be omitted if this     #
+#                               is not required, default="".                  #
+#                                                                             #
+#   Returns:    int:    the updated file_count.                               #
+#                                                                             #
+#   Raises:                                                                   #
+#       FileNotFoundError   -   when the sourced file can't be resolved.      #
+#                                                                             #
+#   Description:                                                              #
+#       Execute a :FRAGMENT command: open the sourced fragment file and       #
+#       parse it to the specified output file, or to the next default         #
+#       output file when no output is specified.                              #
+#                                                                             #
+###############################################################################
+def _handle_fragment(cmd, path, file_count, file_name, line_no, line):
+    fragfile = fragment.open_fragment(cmd[1], path)
+    
+    if cmd[2:] and cmd[2] != "":
+        outfile = shared.open_output(cmd[2])
+    else:
+        outfile = shared.open_output(f"{file_count}.out")
+        
+        file_count += 1
+    
+    fragment.parse_fragment(fragfile, outfile)
+    
+    return file_count
+
+
+###############################################################################
+#                                                                             #
+#   Method:                                                                   #
+#       _handle_parametric(cmd, path, file_count, file_name, line_no, line)   #
+#                                                                             #
+#   Parameters:                                                               #
+#       cmd         -   list:   the normal fields of a valid parsed command,  #
+#                               i.e. `command[1:-1]` as sliced by             #
+#                               `_parse_blueprint_command()`, required.       #
+#                                                                             #
+#       path        -   string: the path to the file being parsed, used to    #
+#                               resolve the name of the sourced file,         #
+#                               default=None.                                 #
+#                                                                             #
+#       file_count  -   int:    the number of default files already           #
+#                               written, default=0.                           #
+#                                                                             #
+#       file_name   -   string: the name of the file, only used for error     #
+#                               messages so may safely be omitted if this     #
+#                               is not required, default="".                  #
+#                                                                             #
+#       line_no     -   int:    the line number from the file, only used      #
+#                               error messages so may safely be omitted if    #
+#                               this is not required, default=0.              #
+#                                                                             #
+#       line        -   string: the line from the file, only used for error   #
+#                               messages so may safely be omitted if this     #
+#                               is not required, default="".                  #
+#                                                                             #
+#   Returns:    int:    the updated file_count.                               #
+#                                                                             #
+#   Raises:                                                                   #
+#       FileNotFoundError   -   when the sourced file can't be resolved.      #
+#                                                                             #
+#   Description:                                                              #
+#       Execute a :PARAMETRIC command: open the sourced parametric file,      #
+#       bind any parameter fields and parse it to the specified output        #
+#       file, or to the next default output file when no output is            #
+#       specified.                                                            #
+#                                                                             #
+###############################################################################
+def _handle_parametric(cmd, path, file_count, file_name, line_no, line):
+    parafile = parametric.open_parametric(cmd[1], path)
+    
+    if cmd[2:] and cmd[2] != "":
+        outfile = shared.open_output(cmd[2])
+    else:
+        outfile = shared.open_output(f"{file_count}.out")
+        
+        file_count += 1
+    
+    params = parametric.parse_parameters(cmd[3:], file_name, line_no, line)
+    
+    parametric.parse_parametric(parafile, outfile, params)
+    
+    return file_count
+
+
+###############################################################################
+#                                                                             #
+#   Blueprint Constants:                                                      #
+#           _HANDLERS   -   A dict mapping each valid blueprint command       #
+#                           name to the method which executes it. Built       #
+#                           once at import (after the handlers below) so      #
+#                           `_parse_blueprint_command()` selects a handler    #
+#                           with a single hash lookup instead of comparing    #
+#                           the command name against each ID in turn.         #
+#                                                                             #
+###############################################################################
+_HANDLERS = { shared.BLUEPRINT_ID:  _handle_blueprint,
+              shared.TEMPLATE_ID:   _handle_template,
+              shared.FRAGMENT_ID:   _handle_fragment,
+              shared.PARAMETRIC_ID: _handle_parametric }
+
+
 ###############################################################################
 #                                                                             #
 #   Method:                                                                   #
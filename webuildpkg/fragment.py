@@ -9,7 +9,7 @@
 ####             `web-build` utility file standard.                        ####
 ####                                                                       ####
 ####    Constants:                                                         ####
-####        FRAGMENT_EXTS   -   list:   Fragment file extension strs.      ####
+####        FRAGMENT_EXTS   -   tuple:  Fragment file extension strs.      ####
 ####                                                                       ####
 ####    Methods:                                                           ####
 ####        main(args)                                                     ####
@@ -26,7 +26,7 @@
 ####                                                                       ####
 ###############################################################################
 ###############################################################################
-import traceback
+import shutil
 import sys
 
 try:
@@ -38,13 +38,15 @@ except ImportError:
 ###############################################################################
 #                                                                             #
 #   Fragment Constants:                                                       #
-#           FRAGMENT_EXTS   -   A priority ordered list of default file       #
+#           FRAGMENT_EXTS   -   A priority ordered tuple of default file      #
 #                               extension to append to fragment file          #
 #                               identifiers. `open_fragment()` will try       #
-#                               each in turn until one succeeds.              #
+#                               each in turn until one succeeds. A tuple      #
+#                               so it can key the resolution cache without    #
+#                               conversion at each call.                      #
 #                                                                             #
 ###############################################################################
-FRAGMENT_EXTS = ["", ".fragment", ".frag"]
+FRAGMENT_EXTS = ("", ".fragment", ".frag")
 
 
 ###############################################################################
@@ -119,23 +121,7 @@ def main(args):
 #                                                                             #
 ###############################################################################
 def open_fragment(name, path=None):
-    if name in shared.STDINS:
-        return sys.stdin
-    
-    if path and name[0] != '/':
-        name = f"{path}/{name}"
-    
-    for ext in FRAGMENT_EXTS:
-        try:
-            f = open(name + ext, 'r')
-        except (FileNotFoundError, IsADirectoryError):
-            pass
-        else:
-            return f
-    
-    raise FileNotFoundError(
-        f"Not any such file, tried: "
-        f"'{'\', \''.join([name + ext for ext in FRAGMENT_EXTS])}'.")
+    return shared.open_input(name, path, FRAGMENT_EXTS)
 
 
 ###############################################################################
@@ -166,7 +152,9 @@ def open_fragment(name, path=None):
 #                                                                             #
 #   Description:                                                              #
 #       Parses a fragment file (see README) and writes the results to the     #
-#       specified output file.                                                #
+#       specified output file. After the declaration is consumed the body     #
+#       is a verbatim copy, so it is streamed in buffer-sized chunks by       #
+#       `shutil.copyfileobj()` rather than line by line.                      #
 #                                                                             #
 ###############################################################################
 def parse_fragment(infile, outfile, line_no=0):
@@ -186,14 +174,11 @@ def parse_fragment(infile, outfile, line_no=0):
             
             _assert_fragment(command, infile.name, line_no, line)
         except shared.ParseError as e:
-            traceback.print_exception(e)
+            shared.warn(e)
             
             outfile.write(line)
     
-    while (line := infile.readline()):
-        line_no += 1
-        
-        outfile.write(line)
+    shutil.copyfileobj(infile, outfile, shared.BUFFER_SIZE)
 
 
 ###############################################################################
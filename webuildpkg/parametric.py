@@ -9,7 +9,7 @@
 ####             the `web-build` utility file standard.                    ####
 ####                                                                       ####
 ####    Constants:                                                         ####
-####        PARAMETRIC_EXTS -   list:   Parametric file extension strs.    ####
+####        PARAMETRIC_EXTS -   tuple:  Parametric file extension strs.    ####
 ####                                                                       ####
 ####    Methods:                                                           ####
 ####        main(args)                                                     ####
@@ -33,21 +33,12 @@
 ####        _parse_parametric_line(line, params, file_name, line_no)       ####
 ####                -   Parse a (non-command) parametric file line.        ####
 ####                                                                       ####
-####        _escape_state_machine(c, escape)                               ####
-####                -   State machine to track escape characters.          ####
-####                                                                       ####
-####        _macro_state_machine(                                          ####
-####                        d, e, in_macro, transition, out_line, macro    ####
-####                        params, file_name, line_no, pos, line)         ####
-####                -   State machine to track parameter tags.             ####
-####                                                                       ####
 ####        _get_parameter(params, param,                                  ####
 ####                       file_name, line_no, pos, line)                  ####
 ####                -   Retrive a bound parameter.                         ####
 ####                                                                       ####
 ###############################################################################
 ###############################################################################
-import traceback
 import sys
 
 try:
@@ -59,13 +50,16 @@ except ImportError:
 ###############################################################################
 #                                                                             #
 #   Parametric Constants:                                                     #
-#           PARAMETRIC_EXTS     -   A priority ordered list of default file   #
-#                                   extension to append to parametric file    #
-#                                   identifiers. `open_parametric()` will     #
-#                                   try each in turn until one succeeds.      #
+#           PARAMETRIC_EXTS     -   A priority ordered tuple of default       #
+#                                   file extension to append to parametric    #
+#                                   file identifiers. `open_parametric()`     #
+#                                   will try each in turn until one           #
+#                                   succeeds. A tuple so it can key the       #
+#                                   resolution cache without conversion at    #
+#                                   each call.                                #
 #                                                                             #
 ###############################################################################
-PARAMETRIC_EXTS = ["", ".parametric", ".param"]
+PARAMETRIC_EXTS = ("", ".parametric", ".param")
 
 
 ###############################################################################
@@ -143,29 +137,13 @@ def main(args):
 #                                                                             #
 ###############################################################################
 def open_parametric(name, path=None):
-    if name in shared.STDINS:
-        return sys.stdin
-    
-    if path and name[0] != '/':
-        name = f"{path}/{name}"
-    
-    for ext in PARAMETRIC_EXTS:
-        try:
-            f = open(name + ext, 'r')
-        except (FileNotFoundError, IsADirectoryError):
-            pass
-        else:
-            return f
-    
-    raise FileNotFoundError(
-        f"Not any such file, tried: "
-        f"'{'\', \''.join([name + ext for ext in PARAMETRIC_EXTS])}'.")
+    return shared.open_input(name, path, PARAMETRIC_EXTS)
 
 
 ###############################################################################
 #                                                                             #
 #   Method:                                                                   #
-#       parse_parametric(infile, outfile, params={}, line_no=0)               #
+#       parse_parametric(infile, outfile, params=None, line_no=0)             #
 #                                                                             #
 #   Parameters:                                                               #
 #       infile      -   file:   an open input file, should be a valid         #
@@ -178,7 +156,8 @@ def open_parametric(name, path=None):
 #       params      -   dict:   the substitution parameters used for          #
 #                               parsing the parametric file. Each parameter   #
 #                               must be a key in the dict, the value is the   #
-#                               substitution, default={}.                     #
+#                               substitution, a fresh empty dict is used if   #
+#                               None or omitted, default=None.                #
 #                                                                             #
 #       line_no     -   int:    the initial line number, default value is     #
 #                               the beginning of the file. The file           #
@@ -203,7 +182,10 @@ def open_parametric(name, path=None):
 #       README) and writes the results to the specified output file.          #
 #                                                                             #
 ###############################################################################
-def parse_parametric(infile, outfile, params={}, line_no=0):
+def parse_parametric(infile, outfile, params=None, line_no=0):
+    if params is None:
+        params = {}
+    
     if line_no == 0:
         line, line_no = shared.parse_shebang(infile)
         
@@ -221,24 +203,30 @@ def parse_parametric(infile, outfile, params={}, line_no=0):
     
     command = None
     
-    while (line := infile.readline()):
+    parse_command, file_name, write = \
+                            shared.parse_command, infile.name, outfile.write
+    
+    for line in infile:
         line_no += 1
         
+        if command is None and line.lstrip()[:1] != ':':
+            write(_parse_parametric_line(line, params, file_name, line_no))
+            
+            continue
+        
         try:
-            command, done = shared.parse_command(
-                                        line, infile.name, line_no, command)
+            command, done = parse_command(line, file_name, line_no, command)
             
             if done:
-                _param(command, params, infile.name, line_no, line)
+                _param(command, params, file_name, line_no, line)
                 
                 command = None
         except shared.ParseError:
-            outfile.write(
-                _parse_parametric_line(line, params, infile.name, line_no))
+            write(_parse_parametric_line(line, params, file_name, line_no))
             
             command = None
         except ValueError as e:
-            traceback.print_exception(e)
+            shared.warn(e)
             
             command = None
 
@@ -278,30 +266,38 @@ def parse_parametric(infile, outfile, params={}, line_no=0):
 #       Note that if `file_name` or `line` are not provided, the default      #
 #       behaviour is to assume that the source of arguments is the command    #
 #       line `argv`. Error messages are formatted with this in mind.          #
+#       Parameter names are interned: the same names recur across every       #
+#       invocation of a parametric file, so interning deduplicates the key    #
+#       strings and lets later dict lookups short-circuit on identity.        #
 #                                                                             #
 ###############################################################################
 def parse_parameters(args, file_name="argv", line_no=0, line=None):
     params = {}
     
     for arg in args:
-        escape = False
-        
-        name_val = [""]
-        
-        for c in arg:
-            if escape:
-                name_val[-1] += c
-                
-                escape = False
-            elif c == '\\':
-                escape = True
-            elif c == '=':
-                name_val += [""]
-            else:
-                name_val[-1] += c
+        if '\\' not in arg:     # No escapes, split at C level.
+            name_val = arg.split('=')
+        else:
+            escape = False
+            
+            name_val = [[]]
+            
+            for c in arg:
+                if escape:
+                    name_val[-1].append(c)
+                    
+                    escape = False
+                elif c == '\\':
+                    escape = True
+                elif c == '=':
+                    name_val.append([])
+                else:
+                    name_val[-1].append(c)
+            
+            name_val = [''.join(field) for field in name_val]
         
         if len(name_val) == 2:
-            params[name_val[0]] = name_val[1]
+            params[sys.intern(name_val[0])] = name_val[1]
         else:
             if line == None:
                 line = ' '.join(args)
@@ -311,8 +307,7 @@ def parse_parameters(args, file_name="argv", line_no=0, line=None):
             except ValueError:
                 idx = 0
             
-            traceback.print_exception(
-                            shared.ParameterError(
+            shared.warn(shared.ParameterError(
                                 f"Bad parameter binding field \"{arg}\". "
                                 f"Elements: {name_val}",
                                 (file_name, line_no, idx, line)))
@@ -364,24 +359,24 @@ def parse_parameters(args, file_name="argv", line_no=0, line=None):
 #                                                                             #
 ###############################################################################
 def _param(command, params, file_name="", line_no=0, line=""):
-    cmd = command[1:-1] + ["", "", "", ""]
-    
-    if cmd[0:2] != ["", "PARAM"]:
+    if len(command) < 4 or command[1] != "" or command[2] != "PARAM":
         raise ValueError(f"Command {command} is not a parameter declaration.")
     
-    if cmd[2] in params.keys():
+    cmd = command[1:-1] + ["", "", "", ""]
+    
+    if cmd[2] in params:
         return
     
     if cmd[3] == "True" and cmd[4] == "":
         raise shared.ParameterError(f"Missing required parameter {cmd[2]}",
                                     (file_name, line_no, 1, line.strip()))
     elif cmd[3] == "True":
-        traceback.print_exception(shared.ParameterError(
+        shared.warn(shared.ParameterError(
             f"Missing required parameter {cmd[2]} with default value "
             f"'{cmd[4]}'",
             (file_name, line_no, 1, line.strip())))
     elif cmd[3] == "" and cmd[4] == "":
-        traceback.print_exception(shared.ParameterError(
+        shared.warn(shared.ParameterError(
             f"Missing parameter '{cmd[2]}', (default='')",
             (file_name, line_no, 1, line.strip())))
     
@@ -460,202 +455,101 @@ def _assert_parametric(command, file_name="", line_no=0, line=""):
 #       substitutions (see README). Escapes are correctly processed and       #
 #       parameter substitutions are performed. This method assumes that the   #
 #       line is not a valid command so this should have been checked first    #
-#       (with `shared.parse_command()` and `_param()`. Note that this         #
-#       method makes use of another two helper methods which provide the      #
-#       state-machines for line parsing: `_escape_state_machine()` and        #
-#       `_macro_state_machine()`.                                             #
+#       (with `shared.parse_command()` and `_param()`. The line is scanned    #
+#       in whole segments between the characters which can affect state       #
+#       ('\' and '<' outside a parameter tag, '\' and ']' inside one),        #
+#       located with C level `str.find()`, rather than character by           #
+#       character; an unescaped "<[" opens a tag and an unescaped "]>"        #
+#       closes it, exactly as the previous state-machine pair specified.      #
+#       Lines containing neither '<' nor '\' (the vast majority in most       #
+#       parametric files) are returned unchanged after two C level scans.     #
 #                                                                             #
 ###############################################################################
 def _parse_parametric_line(line, params, file_name="", line_no=0):
-    in_macro, transition, escape = False, False, False
-        
-    out_line = ""
-    macro = ""
+    if '<' not in line and '\\' not in line:
+        return line
     
-    pos = 0
+    out_line = []
     
-    for c in line:
-        pos += 1
-        
-        d, e, escape = _escape_state_machine(c, escape)
-        
-        out_line, macro, in_macro, transition \
-            = _macro_state_machine(
-                    d, e, in_macro, transition, out_line, macro, params,
-                    file_name=file_name, line_no=line_no, pos=pos, line=line)
+    pos, end = 0, len(line)
     
-    return out_line
-
-
-###############################################################################
-#                                                                             #
-#   Method:                                                                   #
-#       _escape_state_machine(c, escape)                                      #
-#                                                                             #
-#   Parameters:                                                               #
-#       c           -   string: a single character of line input,             #
-#                               required.                                     #
-#                                                                             #
-#       escape      -   bool:   the "current" state of this state-machine,    #
-#                               required.                                     #
-#                                                                             #
-#   Returns:                                                                  #
-#       string: the control character output to the next state-machine.       #
-#       string: the output character output to the next state-machine.        #
-#       bool:   the "new" state of this state-machine.                        #
-#                                                                             #
-#   Raises:                                                                   #
-#       Normally nothing unless something is actually wrong with the call.    #
-#                                                                             #
-#   Description:                                                              #
-#       This state-machine has just two states, represented by the boolean    #
-#       value of the `escape` variable. `escape` is `True` exactly when the   #
-#       last consumed character was an unescaped escape character.            #
-#                                                                             #
-#       Consume a single character of line input, update the state and        #
-#       output two characters (which may be empty) which will be parsed to    #
-#       the next state-machine. The first character will either be the        #
-#       input, if unescaped, or empty, if escaped. The next machine will      #
-#       use this value to update its state. The second value will either be   #
-#       the input, if it is not an unescaped escape character, or empty, it   #
-#       it is. The next machine may use this value to generate its output.    #
-#                                                                             #
-###############################################################################
-def _escape_state_machine(c, escape):
-    if escape:
-        d = ''
-        e = c
+    while pos < end:
+        nxt = end
         
-        escape = False
-    elif c == '\\':
-        d = ''
-        e = ''
-        
-        escape = True
-    else:
-        d = c
-        e = c
-    
-    return d, e, escape
-
-
-###############################################################################
-#                                                                             #
-#   Method:                                                                   #
-#       _macro_state_machine(                                                 #
-#               d, e, in_macro, transition, out_line, macro, params,          #
-#               file_name="", line_no=0, pos=1, line=None)                    #
-#                                                                             #
-#   Parameters:                                                               #
-#       d           -   string: zero or one characters which may be a         #
-#                               control character indicating the beginning    #
-#                               or end of a substitution parameter,           #
-#                               required.                                     #
-#                                                                             #
-#       e           -   string: zero or one characters which might form       #
-#                               part of the parsed output, required.          #
-#                                                                             #
-#       in_macro    -   bool:   part of the "current" state of this state-    #
-#                               machine, True exactly when the context is     #
-#                               inside a substitution parameter tag which     #
-#                               has been completely opened and not            #
-#                               completely closed, required.                  #
-#                                                                             #
-#       transition  -   bool:   part of the "current" state of this state-    #
-#                               machine, True exactly when the first but      #
-#                               not the second character of the opening or    #
-#                               closing parameter tag sequence has been       #
-#                               consumed in a context where the second        #
-#                               character would change the value of           #
-#                               `in_macro`, required.                         #
-#                                                                             #
-#       out_line    -   string: the parsed output line up to this point,      #
-#                               this method will add its output to the        #
-#                               given string if the current context is not    #
-#                               `in_macro`, required.                         #
-#                                                                             #
-#       macro       -   string: the (iteratively constructed, partial) name   #
-#                               of the current substitution parameter, this   #
-#                               method will add its output to the given       #
-#                               string when the current context is            #
-#                               `in_macro`, required.                         #
-#                                                                             #
-#       params      -   dict:   the substitution parameters used for          #
-#                               parsing the parametric file, required.        #
-#                                                                             #
-#       file_name   -   string: the name of the file, only used for error     #
-#                               messages so may safely be omitted if this     #
-#                               is not required, default="".                  #
-#                                                                             #
-#       line_no     -   int:    the line number from the file, only used      #
-#                               for error messages so may safely be omitted   #
-#                               if this is not required, default=0.           #
-#                                                                             #
-#       pos         -   int:    the position in the line, only used for       #
-#                               error messages so may safely be omitted if    #
-#                               this is not required, default=1.              #
-#                                                                             #
-#       line        -   string: the line from the file, only used for error   #
-#                               messages so may safely be omitted if this     #
-#                               is not required, default="".                  #
-#                                                                             #
-#   Returns:                                                                  #
-#       string: the updated value of `out_line`.                              #
-#       string: the updated value of `macro`.                                 #
-#       bool:   part of the "new" state of this state-machine, the updated    #
-#               value of `in_macro`.                                          #
-#       bool:   part of the "new" state of this state-machine, the updated    #
-#               value of `transition`.                                        #
-#                                                                             #
-#   Raises:                                                                   #
-#       Normally nothing unless something is actually wrong with the call.    #
-#                                                                             #
-#   Description:                                                              #
-#       This state-machine four states, represented by a pair of boolean      #
-#       value, the `in_macro` and `transition` variables. `in_macro` is       #
-#       `True` exactly when the unescaped substring "<[" has been consumed    #
-#       and the unescaped substring "]>" has not been since consumed.         #
-#       `transition` is `True` exactly when `in_macro` is `False` and the     #
-#       last character was an unescaped '<' or `in_macro` is `True` and the   #
-#       last character was an unescaped ']'.                                  #
-#                                                                             #
-#       Consume the output of a single cycle of `_escape_state_machine()`,    #
-#       update the state and update the parsed output and current parameter   #
-#       name as appropriate. Which of these variables will be extended        #
-#       depends upon the context however the `out_line` value will contain    #
-#       the iteratively generated parsed output once this state-machine and   #
-#       its predecessor have consumed the entire input line.                  #
-#                                                                             #
-###############################################################################
-def _macro_state_machine(d, e, in_macro, transition, out_line, macro, params,
-                         file_name="", line_no=0, pos=1, line=None):
-    if in_macro and transition and d == '>':
-        in_macro, transition = False, False
-        
-        out_line += _get_parameter(params, macro, file_name=file_name,
-                                   line_no=line_no, pos=pos, line=line)
-    elif in_macro and transition:
-        transition = False
-        
-        macro += (']' + e)
-    elif in_macro and d == ']':
-        transition = True
-    elif in_macro:
-        macro += e
-    elif transition and d == '[':
-        in_macro, transition = True, False
+        for c in "\\<":
+            idx = line.find(c, pos, nxt)
+            
+            if idx != -1:
+                nxt = idx
         
-        macro = ""
-    elif transition:
-        transition = False
+        out_line.append(line[pos:nxt])
         
-        out_line += ('<' + e)
-    elif d == '<':
-        transition = True
-    else:
-        out_line += e
+        if nxt == end:
+            break
+        elif line[nxt] == '\\':
+            if nxt + 1 < end:
+                out_line.append(line[nxt + 1])
+            
+            pos = nxt + 2
+        elif nxt + 1 == end:                    # Trailing unresolved '<'
+            pos = end
+        elif line[nxt + 1] == '[':              # "<[" opens a macro tag
+            macro = []
+            
+            pos = nxt + 2
+            
+            while pos < end:
+                nxt = end
+                
+                for c in "\\]":
+                    idx = line.find(c, pos, nxt)
+                    
+                    if idx != -1:
+                        nxt = idx
+                
+                macro.append(line[pos:nxt])
+                
+                if nxt == end:
+                    pos = end                   # Unclosed tag is discarded
+                elif line[nxt] == '\\':
+                    if nxt + 1 < end:
+                        macro.append(line[nxt + 1])
+                    
+                    pos = nxt + 2
+                elif nxt + 1 == end:            # Trailing unresolved ']'
+                    pos = end
+                elif line[nxt + 1] == '>':      # "]>" closes the tag
+                    out_line.append(_get_parameter(
+                            params, ''.join(macro), file_name=file_name,
+                            line_no=line_no, pos=nxt + 2, line=line))
+                    
+                    pos = nxt + 2
+                    
+                    break
+                elif line[nxt + 1] == '\\':
+                    macro.append(']')
+                    
+                    if nxt + 2 < end:
+                        macro.append(line[nxt + 2])
+                    
+                    pos = nxt + 3
+                else:
+                    macro.append(']' + line[nxt + 1])
+                    
+                    pos = nxt + 2
+        elif line[nxt + 1] == '\\':             # '<' then an escape
+            out_line.append('<')
+            
+            if nxt + 2 < end:
+                out_line.append(line[nxt + 2])
+            
+            pos = nxt + 3
+        else:                                   # '<' not opening a tag
+            out_line.append('<' + line[nxt + 1])
+            
+            pos = nxt + 2
     
-    return out_line, macro, in_macro, transition
+    return ''.join(out_line)
 
 
 ###############################################################################
@@ -705,8 +599,7 @@ def _get_parameter(params, param, file_name="", line_no=0, pos=1, line=None):
     try:
         return params[param]
     except KeyError:
-        traceback.print_exception(
-                        shared.ParameterError(
+        shared.warn(shared.ParameterError(
                                 f"Missing parameter '{param}', (default='')",
                                 (file_name, line_no, pos, line)))
         
@@ -10,13 +10,16 @@
 ####             `web-build` files.                                        ####
 ####                                                                       ####
 ####    Constants:                                                         ####
-####        STDINS          -   list:   STDIN indicator strings.           ####
-####        STDOUTS         -   list:   STDOUT indicator strings.          ####
+####        STDINS          -   frozenset:  STDIN indicator strings.       ####
+####        STDOUTS         -   frozenset:  STDOUT indicator strings.      ####
 ####        BLUEPRINT_ID    -   string: Indicates blueprint file.          ####
 ####        TEMPLATE_ID     -   string: Indicates template file.           ####
 ####        FRAGMENT_ID     -   string: Indicates fragment file.           ####
 ####        PARAMETRIC_ID   -   string: Indicates parametric file.         ####
-####        FILE_IDS        -   list:   The file IDs above in a list.      ####
+####        FILE_IDS        -   frozenset:  The file IDs above, as a set.  ####
+####                                                                       ####
+####        WARN            -   bool:   Should warnings be emitted?        ####
+####        BUFFER_SIZE     -   int:    I/O buffer size for file opens.    ####
 ####                                                                       ####
 ####    Classes:                                                           ####
 ####        ParseError      -   Exception for file syntax errors.          ####
@@ -26,9 +29,15 @@
 ####        open_output(name)                                              ####
 ####                -   Provide an output file for a given name.           ####
 ####                                                                       ####
-####        open_input(name)                                               ####
+####        open_input(name, path, exts)                                   ####
 ####                -   Provide an input file for a given name.            ####
 ####                                                                       ####
+####        resolve_input(name, path, exts)                                ####
+####                -   Resolve an input name to a file path.              ####
+####                                                                       ####
+####        _probe_input(name, exts)                                       ####
+####                -   Memoized existence probe for input names.          ####
+####                                                                       ####
 ####        get_file_type(infile, outfile)                                 ####
 ####                -   Get the file type of a web-build file.             ####
 ####                                                                       ####
@@ -41,23 +50,30 @@
 ####        parse_command(line, file_name, line_no, base_command)          ####
 ####                -   Convert a file line into a canonical command.      ####
 ####                                                                       ####
+####        warn(error)                                                    ####
+####                -   Print a non-fatal exception unless suppressed.     ####
+####                                                                       ####
 ###############################################################################
 ###############################################################################
+import functools
 import traceback
 import pathlib
 import sys
+import os
 
 
 ###############################################################################
 #                                                                             #
 #   Shared Constants:                                                         #
-#           STDINS          -   A list of strings which indicate that an      #
-#                               input stream should be mapped to stdin,       #
-#                               rather than to a regular file.                #
+#           STDINS          -   A frozenset of strings which indicate that    #
+#                               an input stream should be mapped to stdin,    #
+#                               rather than to a regular file. Frozen for     #
+#                               O(1) membership at each open.                 #
 #                                                                             #
-#           STDOUTS         -   A list of strings which indicate that an      #
-#                               input stream should be mapped to stdout,      #
-#                               rather than to a regular file.                #
+#           STDOUTS         -   A frozenset of strings which indicate that    #
+#                               an output stream should be mapped to          #
+#                               stdout, rather than to a regular file.        #
+#                               Frozen for O(1) membership at each open.      #
 #                                                                             #
 #           BLUEPRINT_ID    -   The file and command ID string for            #
 #                               blueprint files. This appears in the          #
@@ -83,22 +99,44 @@ import sys
 #                               also the name (field 1) of the command for    #
 #                               invoking parametric files.                    #
 #                                                                             #
-#           FILE_IDS        -   A list of all valid file IDs, those           #
-#                               specified above.                              #
+#           FILE_IDS        -   A frozenset of all valid file IDs, those      #
+#                               specified above. Command and declaration      #
+#                               parsing tests membership of this set for      #
+#                               every command line, so it is frozen for       #
+#                               O(1) lookup.                                  #
+#                                                                             #
+#           WARN            -   Should non-fatal diagnostics be printed?      #
+#                               Set the environment variable WEBUILD_WARN     #
+#                               to 0 to suppress warning output (and its      #
+#                               formatting cost) for files which are known    #
+#                               to produce many warnings.                     #
+#                                                                             #
+#           BUFFER_SIZE     -   The buffer size, in bytes, used when          #
+#                               opening input and output files. The           #
+#                               platform default (the file system block       #
+#                               size, typically 4-8 KiB) costs one            #
+#                               read/write syscall per block; 128 KiB cuts    #
+#                               the syscall count by an order of magnitude    #
+#                               for file streaming. Override with the         #
+#                               environment variable WEBUILD_BUFSIZE.         #
 #                                                                             #
 ###############################################################################
-STDINS  = ['-', "<stdin>"]
-STDOUTS = ['-', "<stdout>"]
+STDINS  = frozenset({ '-', "<stdin>"  })
+STDOUTS = frozenset({ '-', "<stdout>" })
 
 BLUEPRINT_ID  = "BLUEPRINT"
 TEMPLATE_ID   = "TEMPLATE"
 FRAGMENT_ID   = "FRAGMENT"
 PARAMETRIC_ID = "PARAMETRIC"
 
-FILE_IDS = [ BLUEPRINT_ID,
-             TEMPLATE_ID,
-             FRAGMENT_ID,
-             PARAMETRIC_ID ]
+FILE_IDS = frozenset({ BLUEPRINT_ID,
+                       TEMPLATE_ID,
+                       FRAGMENT_ID,
+                       PARAMETRIC_ID })
+
+WARN = os.environ.get("WEBUILD_WARN", "1") != "0"
+
+BUFFER_SIZE = int(os.environ.get("WEBUILD_BUFSIZE", 1 << 17))
 
 
 ###############################################################################
@@ -145,36 +183,144 @@ def open_output(name):
     pathlib.Path(get_file_path(name)).mkdir(parents=True, exist_ok=True)
     
     if name in STDOUTS:
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(line_buffering=False, write_through=False)
+        
         return sys.stdout
     
-    return open(name, 'w')
+    return open(name, 'w', buffering=BUFFER_SIZE)
 
 
 ###############################################################################
 #                                                                             #
 #   Method:                                                                   #
-#       open_input(name)                                                      #
+#       open_input(name, path=None, exts=("",))                               #
 #                                                                             #
 #   Parameters:                                                               #
 #       name        -   string: the file name or handle to open as an input   #
 #                               file, required.                               #
 #                                                                             #
+#       path        -   string: the context path for name resolution,         #
+#                               default=None.                                 #
+#                                                                             #
+#       exts        -   list:   a priority ordered list of file extensions    #
+#                               to append to `name` during resolution,        #
+#                               default=("",).                                #
+#                                                                             #
 #   Returns:    file:   an open file which can be read from.                  #
 #                                                                             #
 #   Raises:                                                                   #
-#       Anything that builtin `open(name, 'r')` might raise.                  #
+#       FileNotFoundError   -   when `name` can't be resolved to a regular    #
+#                               file (or a standard stream).                  #
+#                                                                             #
+#       PermissionError     -   when `name` resolves to a file which the      #
+#                               python instance does not have permission to   #
+#                               read.                                         #
 #                                                                             #
 #   Description:                                                              #
-#       Opens and returns a readable file with the provided `name` unless     #
-#       `name` indicates that the stdin should be used, i.e. `name` is '-'    #
-#       or "<stdin>", in which case sys.stdin is returned.                    #
+#       Opens and returns a readable file resolved from `name`, `path` and    #
+#       `exts` by `resolve_input()` unless `name` indicates that the stdin    #
+#       should be used, i.e. `name` is '-' or "<stdin>", in which case        #
+#       sys.stdin is returned. Parsers read input files front to back         #
+#       exactly once, so where the platform supports it the kernel is         #
+#       advised of the sequential access pattern to widen readahead and       #
+#       drop pages behind the read position.                                  #
 #                                                                             #
 ###############################################################################
-def open_input(name):
+def open_input(name, path=None, exts=("",)):
     if name in STDINS:
         return sys.stdin
     
-    return open(name, 'r')
+    infile = open(resolve_input(name, path, tuple(exts)), 'r',
+                  buffering=BUFFER_SIZE)
+    
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(infile.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    
+    return infile
+
+
+###############################################################################
+#                                                                             #
+#   Method:                                                                   #
+#       resolve_input(name, path=None, exts=("",))                            #
+#                                                                             #
+#   Parameters:                                                               #
+#       name        -   string: the file name to resolve to an on disk        #
+#                               file path, required.                          #
+#                                                                             #
+#       path        -   string: the context path for name resolution,         #
+#                               default=None.                                 #
+#                                                                             #
+#       exts        -   tuple:  a priority ordered tuple of file extensions   #
+#                               to append to `name` during resolution,        #
+#                               default=("",).                                #
+#                                                                             #
+#   Returns:    string: the path of the first existing file matching `name`   #
+#                       with an extension from `exts`.                        #
+#                                                                             #
+#   Raises:                                                                   #
+#       FileNotFoundError   -   when `name` can't be resolved to a regular    #
+#                               file.                                         #
+#                                                                             #
+#   Description:                                                              #
+#       Resolves an input file name to the path of an existing file by        #
+#       trying each extension in `exts` in turn. Probes are memoized by       #
+#       `_probe_input()`, misses as well as hits (`lru_cache` can't           #
+#       cache a call which raises), so repeated inclusions of the same        #
+#       source file (or repeated failures to find one) don't re-probe the     #
+#       file system; the build is a single short-lived process so             #
+#       resolutions never go stale.                                           #
+#                                                                             #
+###############################################################################
+def resolve_input(name, path=None, exts=("",)):
+    if path and not os.path.isabs(name):
+        name = os.path.join(path, name)
+    
+    found = _probe_input(name, exts)
+    
+    if found is None:
+        raise FileNotFoundError(
+            f"Not any such file, tried: "
+            f"'{'\', \''.join([name + ext for ext in exts])}'.")
+    
+    return found
+
+
+###############################################################################
+#                                                                             #
+#   Method:                                                                   #
+#       _probe_input(name, exts)                                              #
+#                                                                             #
+#   Parameters:                                                               #
+#       name        -   string: the (path joined) file name to probe for on   #
+#                               disk, required.                               #
+#                                                                             #
+#       exts        -   tuple:  a priority ordered tuple of file extensions   #
+#                               to append to `name` during probing,           #
+#                               required.                                     #
+#                                                                             #
+#   Returns:    string: the path of the first existing file matching `name`   #
+#                       with an extension from `exts`, or None when no        #
+#                       candidate exists.                                     #
+#                                                                             #
+#   Raises:                                                                   #
+#       Nothing.                                                              #
+#                                                                             #
+#   Description:                                                              #
+#       Stats each candidate `name` + ext in priority order and returns the   #
+#       first which is a regular file. Returns None rather than raising on    #
+#       a miss so both outcomes land in the cache and a name which resolves   #
+#       to nothing costs its stat calls only once per build.                  #
+#                                                                             #
+###############################################################################
+@functools.lru_cache(maxsize=4096)
+def _probe_input(name, exts):
+    for ext in exts:
+        if os.path.isfile(name + ext):
+            return name + ext
+    
+    return None
 
 
 ###############################################################################
@@ -226,7 +372,7 @@ def get_file_type(infile, outfile=None):
         valid = True
     
     if (not valid) or file_type not in FILE_IDS:
-        traceback.print_exception(ParseError(
+        warn(ParseError(
                                     f"Invalid file declaration '{line}', "
                                     f"assuming fragment file.",
                                     (infile.name, line_no, 1, line.strip())))
@@ -270,8 +416,8 @@ def get_file_path(f):
         path = f
     
     try:
-        return '/'.join(path.split('/')[:-1])
-    except AttributeError:  # path is not a string
+        return os.path.dirname(path)
+    except TypeError:   # path is not a string
         return ""
 
 
@@ -356,20 +502,44 @@ def parse_command(line, file_name="", line_no=0, base_command=None):
     
     semicolon, escape = False, False
     
-    for c in line.split('\n')[0]:
-        if escape or semicolon:
-            command[-1] += c
-            escape = False
-        elif c == '\\':
-            escape = True
-        elif c == ':':
+    content = line.split('\n')[0]
+    
+    pos, end = 0, len(content)
+    
+    while pos < end:
+        nxt = end
+        
+        for c in ":;\\":
+            idx = content.find(c, pos, nxt)
+            
+            if idx != -1:
+                nxt = idx
+        
+        command[-1] += content[pos:nxt]
+        
+        if nxt == end:
+            break
+        elif content[nxt] == '\\':
+            if nxt + 1 < end:
+                command[-1] += content[nxt + 1]
+                
+                pos = nxt + 2
+            else:
+                escape = True
+                
+                pos = end
+        elif content[nxt] == ':':
             colon = True
+            
             command += [""]
-        elif c == ';':
-            semicolon = True
-            command += [""]
+            
+            pos = nxt + 1
         else:
-            command[-1] += c
+            semicolon = True
+            
+            command += [content[nxt + 1:]]
+            
+            pos = end
     
     if not colon:
         raise ParseError(f"Command initiator ':' missing.",
@@ -386,6 +556,34 @@ def parse_command(line, file_name="", line_no=0, base_command=None):
     return command, not escape
 
 
+###############################################################################
+#                                                                             #
+#   Method:                                                                   #
+#       warn(error)                                                           #
+#                                                                             #
+#   Parameters:                                                               #
+#       error       -   Exception:  the non-fatal exception to report,        #
+#                                   required.                                 #
+#                                                                             #
+#   Returns:    None.                                                         #
+#                                                                             #
+#   Raises:                                                                   #
+#       Normally nothing unless something is actually wrong with the call.    #
+#                                                                             #
+#   Description:                                                              #
+#       Prints an exception to stderr as a warning, unless warning output     #
+#       has been suppressed with WEBUILD_WARN=0. Only the exception itself    #
+#       (including the SyntaxError-style file, line and caret context) is     #
+#       formatted; stack frame walking, source statting and line caching      #
+#       are skipped since warnings carry no useful frames. Parsers should     #
+#       report all non-fatal diagnostics through this method.                 #
+#                                                                             #
+###############################################################################
+def warn(error):
+    if WARN:
+        sys.stderr.write(''.join(traceback.format_exception_only(error)))
+
+
 ###############################################################################
 #                                                                             #
 #   End of Code                                                               #
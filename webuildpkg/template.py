@@ -21,9 +21,6 @@
 ####        parse_template(infile, outfile, line_no)                       ####
 ####                -   Parse an open template file.                       ####
 ####                                                                       ####
-####        _path(f)                                                       ####
-####                -   Get a file object's path.                          ####
-####                                                                       ####
 ####        _parse_template_command(command, outfile, path,                ####
 ####                                file_name, line_no, line)              ####
 ####                -   Parse a command from a template file.              ####
@@ -33,7 +30,6 @@
 ####                                                                       ####
 ###############################################################################
 ###############################################################################
-import traceback
 import sys
 
 try:
@@ -130,23 +126,7 @@ def main(args):
 #                                                                             #
 ###############################################################################
 def open_template(name, path=None):
-    if name in shared.STDINS:
-        return sys.stdin
-    
-    if path and name[0] != '/':
-        name = f"{path}/{name}"
-    
-    for ext in TEMPLATE_EXTS:
-        try:
-            f = open(name + ext, 'r')
-        except (FileNotFoundError, IsADirectoryError):
-            pass
-        else:
-            return f
-    
-    raise FileNotFoundError(
-        f"Not any such file, tried: "
-        f"'{'\', \''.join([name + ext for ext in TEMPLATE_EXTS])}'.")
+    return shared.open_input(name, path, TEMPLATE_EXTS)
 
 
 ###############################################################################
@@ -199,54 +179,32 @@ def parse_template(infile, outfile, line_no=0):
     
     command = None
     
-    while (line := infile.readline()):
+    parse_command, file_name, write = \
+                            shared.parse_command, infile.name, outfile.write
+    
+    for line in infile:
         line_no += 1
         
+        if command is None and line.lstrip()[:1] != ':':
+            write(line)
+            
+            continue
+        
         try:
-            command, done = shared.parse_command(
-                                        line, infile.name, line_no, command)
+            command, done = parse_command(line, file_name, line_no, command)
         except shared.ParseError:
-            outfile.write(line)
+            write(line)
             
             command = None
         else:
             if done:
                 _parse_template_command(
                         command, outfile, shared.get_file_path(infile),
-                                                infile.name, line_no, line)
+                                                file_name, line_no, line)
                 
                 command = None
 
 
-###############################################################################
-#                                                                             #
-#   Method:                                                                   #
-#       _path(f)                                                              #
-#                                                                             #
-#   Parameters:                                                               #
-#       f       -   file:   a file from which to extract the path,            #
-#                           Required.                                         #
-#                                                                             #
-#   Returns:    string: the absolute or relative path to the file.            #
-#                                                                             #
-#   Raises:                                                                   #
-#       TypeError   -   when `f` is not a file, obviously.                    #
-#                                                                             #
-#   Description:                                                              #
-#       Extracts and returns the path component from the `name` property of   #
-#       a given file, this may be a relative or absolute path depending on    #
-#       how the file was opened. Will always be "" if the file was opened     #
-#       directly from the local directory or is a numbered or named file      #
-#       stream not opened from the file system tree.                          #
-#                                                                             #
-###############################################################################
-def _path(f):
-    try:
-        return '/'.join(f.name.split('/')[:-1])
-    except AttributeError:  # f.name is not a string
-        return ""
-
-
 ###############################################################################
 #                                                                             #
 #   Method:                                                                   #